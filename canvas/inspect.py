@@ -6,29 +6,33 @@ to Canvas.
 
 from __future__ import absolute_import
 
-import graphlab
-import graphlab.canvas
-import inspect
-import six
+import operator
+import sys
+
+# Iterate f_locals without copying it into a list on Python 2.
+_iteritems = operator.methodcaller('iteritems' if sys.version_info[0] == 2 else 'items')
 
 def _find_variable_name(var):
     # climb up the stack two frames before checking for non-class variables
-    frame = inspect.currentframe()
     try:
-        frame = frame.f_back.f_back
-        finalFrame = __climb_frame_stack(frame)
-    except:
+        frame = sys._getframe(2)
+    except ValueError:
+        # the stack is shallower than two frames
+        frame = sys._getframe(0)
+    finalFrame = __climb_frame_stack(frame)
+    if finalFrame is None:
         finalFrame = frame
 
     variableDictionary = finalFrame.f_locals
+    from graphlab.canvas import _same_object as same_object
 
-    for k,v in six.iteritems(variableDictionary):
-        if k.startswith('_'):
+    for k,v in _iteritems(variableDictionary):
+        if k[:1] == '_':
             # ignore underscore names, generated by IPython
             continue
-        if graphlab.canvas._same_object(var, v):
+        # identity is the common case; fall back to the structural comparison
+        if v is var or same_object(var, v):
             return (k,v)
-            break
     return (None, None)
 
 def find_vars(var):
@@ -38,7 +42,12 @@ def find_vars(var):
     Given a dictionary of local variables from a stack frame, identify which ones correspond to GraphLab
     Create data structures and store those in _vars so we can update the browser.
     """
-    target = graphlab.canvas.get_target()
+    from graphlab.canvas import get_target
+    from graphlab.canvas.target import NoneTarget
+    target = get_target()
+    if isinstance(target, NoneTarget):
+        # add_variable is a no-op, so skip the frame walk entirely
+        return None
     (variable_name, variable) = _find_variable_name(var)
     if variable_name is not None:
         target.add_variable((variable_name,), variable)
@@ -47,8 +56,10 @@ def find_vars(var):
 
 def __climb_frame_stack(frame):
     """
-
+    Walk up from frame past any method or show() frames, returning the first
+    frame that belongs to user code (or None if the top of the stack is hit).
     """
-    if ('self' in frame.f_locals.keys() or 'show' in frame.f_code.co_name):
-        return __climb_frame_stack(frame.f_back)
+    while frame is not None and \
+            ('self' in frame.f_locals or 'show' in frame.f_code.co_name):
+        frame = frame.f_back
     return frame
@@ -257,7 +257,8 @@ def submit_training_job(env, dataset, target, features=None,
 
     # Regression model names.
     model_name = "classifier_logistic_regression"
-    solver = solver.lower()
+    if not solver.islower():
+        solver = solver.lower()
 
     dml_obj = _sl.create(dataset, target, model_name, env=env, features=features,
                         validation_set = validation_set,